@@ -10,6 +10,11 @@ def main():
 
     data = extract_data(filepaths, parser=SpeciesParser())
     graph = build_graph(data)
+
+    # GraphML does not support tuple attributes, so join species identifiers on export
+    for _, node_data in graph.nodes(data=True):
+        if 'identifiers' in node_data:
+            node_data['identifiers'] = ', '.join(node_data['identifiers'])
     networkx.write_graphml(graph, "graphs/species.graphml")
 
 
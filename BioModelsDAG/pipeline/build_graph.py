@@ -4,21 +4,29 @@ from typing import Iterable, Tuple
 __all__ = ['build_graph']
 
 
-def build_graph(data: Iterable[Tuple[dict, str, dict]]):
+def build_graph(data: Iterable[Tuple[dict, str, dict]], backend='networkx'):
     """
     Builds a NetworkX DiGraph object from (Child, Edge, Parent) triples.
     Each triple is represented as a directed edge from Child to Parent
     in the DiGraph.
 
+    With backend='igraph', builds a directed igraph.Graph instead. Node names
+    are stored in the 'name' vertex attribute and edge labels in the 'label'
+    edge attribute. This requires python-igraph.
+
     Child and Parent must be dictionaries containing all hashable values
     and a 'name' key (this is the name of the node in the DiGraph).
 
     Edge must be a string representing an edge label from Child to Parent.
 
     :param data: Iterable of (Child, Edge, Parent) triples.
-    :rtype: networkx.DiGraph
+    :param backend: Graph library to build the graph with; 'networkx' or 'igraph'.
+    :rtype: networkx.DiGraph or igraph.Graph
     """
-    g = networkx.DiGraph()
+    if backend not in ('networkx', 'igraph'):
+        raise ValueError("backend must be 'networkx' or 'igraph', not {!r}".format(backend))
+
+    nodes, edges = {}, []
 
     for child_attrs, edge, parent_attrs in data:
         if 'name' not in child_attrs or 'name' not in parent_attrs:
@@ -27,16 +35,49 @@ def build_graph(data: Iterable[Tuple[dict, str, dict]]):
                 "Provided Child data: {}\n"
                 "Provided Parent data: {}\n".format(child_attrs, parent_attrs)
             )
-        # Copy dicts so popping 'name' doesn't affect the underlying data
-        child_attrs, parent_attrs = child_attrs.copy(), parent_attrs.copy()
-        child_name, parent_name = child_attrs.pop('name'), parent_attrs.pop('name')
+        child_name, parent_name = child_attrs['name'], parent_attrs['name']
 
         # Update node attributes only if the updated version has strictly more data
         # than the previous version
-        if child_name not in g or set(child_attrs).issuperset(g.nodes[child_name]):
-            g.add_node(child_name, **child_attrs)
-        if parent_name not in g or set(parent_attrs).issuperset(g.nodes[parent_name]):
-            g.add_node(parent_name, **parent_attrs)
-        g.add_edge(child_name, parent_name, label=edge)
+        for name, attrs in ((child_name, child_attrs), (parent_name, parent_attrs)):
+            if name not in nodes or attrs.keys() - {'name'} >= nodes[name].keys():
+                # Copy attributes so dropping 'name' doesn't affect the underlying data
+                nodes[name] = {k: v for k, v in attrs.items() if k != 'name'}
+        edges.append((child_name, parent_name, {'label': edge}))
+
+    if backend == 'igraph':
+        return _build_igraph(nodes, edges)
+
+    # Add all nodes and edges in bulk rather than one NetworkX call per triple
+    g = networkx.DiGraph()
+    g.add_nodes_from(nodes.items())
+    g.add_edges_from(edges)
+
+    return g
+
+
+def _build_igraph(nodes: dict, edges: list):
+    """
+    Builds a directed igraph.Graph from staged nodes and edges.
+
+    :param nodes: Mapping of node name to node attribute dict.
+    :param edges: List of (Child name, Parent name, edge attribute dict) triples.
+    :rtype: igraph.Graph
+    """
+    import igraph
+
+    # igraph allows parallel edges, so keep one edge per (Child, Parent) pair.
+    # The last label seen for a pair wins, as in a NetworkX DiGraph.
+    edge_labels = {(child, parent): attrs['label'] for child, parent, attrs in edges}
+    index = {name: i for i, name in enumerate(nodes)}
+
+    g = igraph.Graph(n=len(nodes), directed=True)
+    g.vs['name'] = list(nodes)
+    # Attributes are set per column; nodes without an attribute get None
+    for key in dict.fromkeys(key for attrs in nodes.values() for key in attrs):
+        g.vs[key] = [attrs.get(key) for attrs in nodes.values()]
+
+    g.add_edges([(index[child], index[parent]) for child, parent in edge_labels])
+    g.es['label'] = list(edge_labels.values())
 
     return g
@@ -12,10 +12,11 @@ class BTOParser(BaseParser):
             bto_lookup = json.load(f)
 
         pattern = re.compile("BTO:\d{7}")
-        model_data = extract_model_data(sbml_file)
+        model = libsbml.readSBMLFromFile(sbml_file.name).getModel()
+
+        model_data = extract_model_data(sbml_file, model=model)
         model_data["color"] = "green"
 
-        model = libsbml.readSBMLFromFile(sbml_file.name).getModel()
         for element in model.getListOfAllElements():
             for bto_id in pattern.findall(element.getAnnotationString()):
                 if bto_id in bto_lookup:
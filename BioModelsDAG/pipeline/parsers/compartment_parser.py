@@ -1,11 +1,28 @@
 from ..bases import BaseParser
-from bs4 import BeautifulSoup
+from BioModelsDAG.utils import RDF_NS, cache_triples, parse_annotation
+from lxml import etree
+from rapidfuzz import fuzz, process
 from typing import Collection
+import libsbml
+import sys
 
 __all__ = ['CompartmentParser']
 
+_RDF_LI_RESOURCES = etree.XPath('.//rdf:li/@rdf:resource', namespaces={'rdf': RDF_NS},
+                               smart_strings=False)
+
 
 class CompartmentParser(BaseParser):
+    def __init__(self):
+        # Lowercased GO compartment names are indexed once per all_go_compartments
+        # collection, and close matches are cached per compartment name.
+        self._go_compartments = None
+        self._go_index = ()
+        self._go_index_choices = []
+        self._exact_matches = {}
+        self._close_matches = {}
+
+    @cache_triples
     def parser(self, sbml_file, all_go_compartments: Collection = (),
                skip_single_cmp_models=False, **kwargs):
         """
@@ -24,55 +41,58 @@ class CompartmentParser(BaseParser):
         """
         from BioModelsDAG.utils import extract_model_data
 
-        soup = BeautifulSoup(sbml_file, features='lxml')
-        compartment_tags = soup.find_all("compartment")
+        model = libsbml.readSBMLFromFile(sbml_file.name).getModel()
+        if model is None:
+            return print("Could not extract SBML model for {}.".format(sbml_file.name))
 
-        if len(compartment_tags) < 2 and skip_single_cmp_models:
+        compartments = model.getListOfCompartments()
+        if len(compartments) < 2 and skip_single_cmp_models:
             return
 
-        model_data = extract_model_data(sbml_file, soup=soup)
+        model_data = extract_model_data(sbml_file, model=model)
 
-        for compartment_tag in compartment_tags:
+        for compartment in compartments:
             compartment_data = {
-                'name': self.get_name(compartment_tag, all_go_compartments).lower(),
+                'name': sys.intern(self.get_name(compartment, all_go_compartments).lower()),
                 # Color compartments yellow
                 'color': 'yellow',
             }
             # Color BioModels green
             model_data['color'] = 'green'
 
-            go_id = self.get_go_id(compartment_tag)
+            go_id = self.get_go_id(compartment)
             if go_id:
                 compartment_data['identifier'] = go_id
 
             yield model_data, 'isPartOf', compartment_data
 
     @staticmethod
-    def get_go_id(compartment_tag: BeautifulSoup):
+    def get_go_id(compartment: libsbml.Compartment):
         """
-        Extracts and returns the GO id annotation from a compartment tag.
+        Extracts and returns the GO id annotation from a compartment.
         If no GO id annotation exists, return None.
 
-        :param compartment_tag: BeautifulSoup Tag for a single compartment
+        :param compartment: libSBML Compartment object for a single compartment
                                 in a multi-compartment model.
         :rtype str
         """
-        try:
-            go_id = compartment_tag.find("rdf:li")['rdf:resource'].split('/')[-1]
-            return go_id
-        # No annotation containing the GO id exists for the SBML compartment tag.
-        except TypeError:
+        annotation = compartment.getAnnotationString()
+        root = parse_annotation(annotation) if annotation else None
+        resources = _RDF_LI_RESOURCES(root) if root is not None else ()
+        # No annotation containing the GO id exists for the SBML compartment.
+        if not resources:
             return None
+        return resources[0].split('/')[-1]
 
-    def get_name(self, compartment_tag: BeautifulSoup, all_go_compartments):
+    def get_name(self, compartment: libsbml.Compartment, all_go_compartments):
         """
-        Extracts and returns the compartment name from a compartment tag.
+        Extracts and returns the compartment name from a compartment.
 
         Uses the GO id annotation if it exists; if not, attempts to
         find a close GO compartment name match. If no satisfactory
-        match is found, use the tag's name/id attribute instead.
+        match is found, use the compartment's name/id instead.
 
-        :param compartment_tag: BeautifulSoup Tag for a single compartment
+        :param compartment: libSBML Compartment object for a single compartment
                                 in a multi-compartment model.
         :param all_go_compartments: Collection of all known GO compartment names.
                                 Acts as a preprocessed data reference for the
@@ -80,18 +100,41 @@ class CompartmentParser(BaseParser):
                                 get_all_go_compartments()
         :rtype: str
         """
-        from BioModelsDAG.utils import get_go_json, go_id_is_valid
-        from difflib import get_close_matches
+        from BioModelsDAG.utils import get_go_name, go_id_is_valid
 
         # Try to extract the Gene Ontology id (GO id)
-        go_id = self.get_go_id(compartment_tag)
+        go_id = self.get_go_id(compartment)
         if go_id and go_id_is_valid(go_id):
             # Look up the GO id and extract the GO compartment name
-            return get_go_json(go_id)['response']['docs'][0]['annotation_class_label']
+            return get_go_name(go_id)
 
         # No GO id found or invalid GO id. Return a good close string match if found
         # or return the attribute name or id.
-        name = compartment_tag.attrs['name'] \
-            if 'name' in compartment_tag.attrs else compartment_tag.attrs['id']
-        close_matches = get_close_matches(name.lower(), all_go_compartments, n=1, cutoff=0.8)
-        return close_matches[0] if close_matches else name
+        name = compartment.getName() or compartment.getId()
+        return self.get_close_match(name.lower(), all_go_compartments) or name
+
+    def get_close_match(self, name: str, all_go_compartments):
+        """
+        Returns the GO compartment name in all_go_compartments that most closely
+        matches 'name' with a similarity ratio of at least 0.8, or None if
+        there is no such match.
+
+        :param name: Lowercased compartment name.
+        :param all_go_compartments: Collection of all known GO compartment names.
+        :rtype: str
+        """
+        if all_go_compartments is not self._go_compartments:
+            self._go_compartments = all_go_compartments
+            self._go_index = tuple(all_go_compartments)
+            self._go_index_choices = [c.lower() for c in self._go_index]
+            self._exact_matches = dict(zip(self._go_index_choices, self._go_index))
+            self._close_matches = {}
+
+        # Fast path: names that are already GO compartment names need no fuzzy matching
+        if name in self._exact_matches:
+            return self._exact_matches[name]
+        if name not in self._close_matches:
+            match = process.extractOne(name, self._go_index_choices, scorer=fuzz.ratio,
+                                       processor=None, score_cutoff=80)
+            self._close_matches[name] = self._go_index[match[2]] if match else None
+        return self._close_matches[name]
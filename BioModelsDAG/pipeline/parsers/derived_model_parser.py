@@ -1,10 +1,14 @@
 from ..bases import BaseParser
-from bs4 import BeautifulSoup
+from BioModelsDAG.utils import cache_triples
+from functools import lru_cache
+import libsbml
+import sys
 
 __all__ = ['DerivedModelParser']
 
 
 class DerivedModelParser(BaseParser):
+    @cache_triples
     def parser(self, sbml_file, **kwargs):
         """
         Extracts all parent models from an SBML file and returns a generator of
@@ -16,18 +20,19 @@ class DerivedModelParser(BaseParser):
         """
         from BioModelsDAG.utils import extract_model_data
 
-        soup = BeautifulSoup(sbml_file, features='lxml')
+        model = libsbml.readSBMLFromFile(sbml_file.name).getModel()
+        if model is None:
+            return print("Could not extract SBML model for {}.".format(sbml_file.name))
 
-        child_data = extract_model_data(sbml_file, soup=soup)
+        child_data = extract_model_data(sbml_file, model=model)
 
-        for parent_URI in self.extract_parent_URIs(soup):
-            parent_name = parent_URI.split("http://identifiers.org/")[-1].split('/')[-1]
-            parent_provider = parent_URI.split("http://identifiers.org/")[-1].split('/')[0]
+        for parent_URI in self.extract_parent_URIs(model):
+            parent_provider, parent_name = self.split_parent_URI(parent_URI)
 
             parent_data = {
                 'name': parent_name,
                 'provider': parent_provider,
-                'URI': parent_URI
+                'URI': sys.intern(parent_URI)
             }
 
             # Color pubmed nodes red, biomodel nodes green
@@ -38,7 +43,34 @@ class DerivedModelParser(BaseParser):
             yield child_data, 'isDerivedFrom', parent_data
 
     @staticmethod
-    def extract_parent_URIs(soup: BeautifulSoup):
-        for resource in soup.find_all('bqmodel:isderivedfrom'):
-            for tag in resource.find_all('rdf:li'):
-                yield tag['rdf:resource']
+    def extract_parent_URIs(model: libsbml.Model):
+        """
+        Returns a generator over all parent model URIs listed in the
+        bqmodel:isDerivedFrom annotations of an SBML model.
+
+        :param model: libsbml.Model object.
+        :rtype: generator
+        """
+        for cv_term in model.getCVTerms():
+            if (cv_term.getQualifierType() == libsbml.MODEL_QUALIFIER
+                    and cv_term.getModelQualifierType() == libsbml.BQM_IS_DERIVED_FROM):
+                for i in range(cv_term.getNumResources()):
+                    yield cv_term.getResourceURI(i)
+
+    @staticmethod
+    @lru_cache(maxsize=None)
+    def split_parent_URI(parent_URI: str):
+        """
+        Splits an identifiers.org URI (e.g. http://identifiers.org/pubmed/12345)
+        into its (provider, name) pair, e.g. ('pubmed', '12345').
+
+        Parent models are shared by many children, so results are cached
+        and the returned strings are interned.
+
+        :param parent_URI: identifiers.org URI of a parent model.
+        :rtype: tuple
+        """
+        identifier = parent_URI.rpartition("http://identifiers.org/")[2]
+        provider = identifier.partition('/')[0]
+        name = identifier.rpartition('/')[2]
+        return sys.intern(provider), sys.intern(name)
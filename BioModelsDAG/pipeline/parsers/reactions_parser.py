@@ -1,5 +1,6 @@
 from ..bases import BaseParser
 from collections import defaultdict
+import sys
 
 __all__ = ['ReactionsParser']
 
@@ -23,19 +24,20 @@ class ReactionsParser(BaseParser):
         if isinstance(counter, dict):
             counter = defaultdict(int, counter)
 
-        model_data = extract_model_data(sbml_file)
-
         model = libsbml.readSBMLFromFile(sbml_file.name).getModel()
         if model is None:
             return print("Could not extract SBML model for {}.".format(sbml_file.name))
 
+        model_data = extract_model_data(sbml_file, model=model)
+
         for reaction in model.getListOfReactions():
-            reaction_name = reaction.getName() if reaction.getName() else reaction.getId()
+            reaction_name = sys.intern(reaction.getName() or reaction.getId())
 
             # Color BioModels green
             model_data['color'] = 'green'
 
             annotation = reaction.getAnnotationString()
+            annotation_identifiers = extract_annotation_identifiers(annotation)
 
             # Extract metadata into counter object
             if counter:
@@ -44,10 +46,10 @@ class ReactionsParser(BaseParser):
                     counter['numUnannotatedReactions'] += 1
                 else:
                     counter['numAnnotatedReactions'] += 1
-                if len(list(extract_annotation_identifiers(annotation))) > 1:
+                if len(annotation_identifiers) > 1:
                     counter['numMultipleURIReactions'] += 1
 
-            identifiers = set(extract_annotation_identifiers(annotation))
+            identifiers = set(annotation_identifiers)
             kegg_identifiers = {i for i in identifiers if 'kegg' in i.lower()}
 
             if any(i.split('/')[-1] in {'GO:0065003', 'GO:0005488'} for i in identifiers):
@@ -1,9 +1,12 @@
 from ..bases import BaseParser
+from BioModelsDAG.utils import cache_triples
+import sys
 
 __all__ = ['SpeciesParser']
 
 
 class SpeciesParser(BaseParser):
+    @cache_triples
     def parser(self, sbml_file, **kwargs):
         """
         Extracts all species from an SBML file and returns a generator of
@@ -17,21 +20,24 @@ class SpeciesParser(BaseParser):
         from BioModelsDAG.utils import extract_annotation_identifiers, extract_model_data
 
         model = libsbml.readSBMLFromFile(sbml_file.name).getModel()
+        if model is None:
+            return print("Could not extract SBML model for {}.".format(sbml_file.name))
 
-        model_data = extract_model_data(sbml_file)
+        # Read the publication date from libsbml rather than parsing sbml_file again
+        model_data = extract_model_data(sbml_file, model=model)
         # Color BioModels green
         model_data['color'] = 'green'
 
-        if model is None:
-            return print("Could not extract SBML model for {}.".format(sbml_file.name))
         for species in model.getListOfSpecies():
-            species_name = species.getName() if species.getName() else species.getId()
+            species_name = sys.intern(species.getName() or species.getId())
 
             annotation = species.getAnnotationString()
+            # Identifiers are kept as a tuple; join them only when exporting the graph
+            identifiers = tuple(sys.intern(uri) for uri in extract_annotation_identifiers(annotation))
 
             species_data = {
                 'name': species_name,
-                'identifiers': ', '.join(extract_annotation_identifiers(annotation)),
+                'identifiers': identifiers,
                 # Color species blue
                 'color': 'blue'
             }
@@ -4,14 +4,15 @@ import libsbml
 
 def yield_classified_reactions():
     for fpath in yield_model_paths():
-        with open(fpath, 'r', encoding='utf8') as sbml_file:
-            model_data = extract_model_data(sbml_file)
         model = libsbml.readSBMLFromFile(fpath).getModel()
         if model is None:
             continue
+        with open(fpath, 'r', encoding='utf8') as sbml_file:
+            model_data = extract_model_data(sbml_file, model=model)
 
         for reaction in model.getListOfReactions():
-            yield (reaction.getId(), classify(reaction, model), *model_data.values())
+            yield (reaction.getId(), classify(reaction, model), model_data['name'],
+                   model_data['provider'], model_data['URI'], model_data.get('created', ''))
 
 
 def main():
@@ -13,7 +13,7 @@ def flatten_reaction_data(data):
     """
     for child, edge, parent in data:
         # Omit color data 
-        parent = [v for k, v in parent.items() if k != 'color']
+        parent = [parent['name'], parent['provider'], parent['URI'], parent.get('created', '')]
         child = [v for k, v in child.items() if k != 'color']
         yield parent + child
 
@@ -1,10 +1,15 @@
 from .download import download_curated_models
 from .timeit import timeit
-from .get_go_json import get_go_json, go_id_is_valid
+from .cache_triples import cache_triples, clear_triple_cache, TRIPLE_CACHE_DIR
+from .get_go_json import get_go_json, get_go_name, go_id_is_valid
 from .yield_model_paths import yield_model_paths
 from .to_csv import to_csv
+from .write_atomic import write_atomic
 from .generators import get_species, get_compartments, get_reactions
-from .helpers import extract_annotation_identifiers, extract_model_data, extract_publication_date
+from .helpers import (
+    extract_annotation_identifiers, extract_model_data, extract_publication_date, w3cdtf_to_date,
+    parse_annotation, RDF_NS
+)
 
 from pathlib import Path
 
@@ -0,0 +1,218 @@
+from functools import wraps
+from pathlib import Path
+from .get_go_json import GO_CACHE_MAX_AGE
+
+__all__ = ['cache_triples', 'clear_triple_cache', 'TRIPLE_CACHE_DIR']
+
+# Entries are ignored once older than TRIPLE_CACHE_MAX_AGE seconds, and deleted by the
+# next process that writes to the cache. Parsers may embed GO labels in their triples,
+# so entries expire along with the GO response cache.
+TRIPLE_CACHE_DIR = Path.home() / ".cache" / "biomodels" / "triples"
+TRIPLE_CACHE_MAX_AGE = GO_CACHE_MAX_AGE
+# Bump to invalidate every cached entry (e.g. when a helper used by the parsers changes)
+TRIPLE_CACHE_VERSION = 1
+
+_expired_entries_removed = False
+
+
+def cache_triples(method):
+    """
+    Decorator. Caches the (Child, Edge, Parent) 3-tuples returned by a
+    BaseParser.parser() implementation in TRIPLE_CACHE_DIR, keyed by the
+    parser class, the source of the parser's module, its arguments and
+    the SBML file's path, modification time and size. On a cache hit, the SBML
+    file is not parsed.
+
+    Pass use_cache=False to the decorated method (or to
+    BioModelsDAG.extract_data()) to parse the file and overwrite its cache entry.
+    Expired entries are deleted automatically; call clear_triple_cache() to
+    delete every entry.
+
+    Only use on parsers without side effects. Calls with arguments that cannot
+    be pickled are not cached.
+
+    :param method: BaseParser.parser() implementation.
+    """
+    import hashlib
+    import inspect
+    import os
+    import pickle
+    import time
+
+    code_fingerprint = _fingerprint(method)
+    signature = inspect.signature(method)
+
+    @wraps(method)
+    def wrapped(self, sbml_file, *args, use_cache=True, **kwargs):
+        try:
+            arguments = _bind_arguments(signature, self, sbml_file, *args, **kwargs)
+        except TypeError:
+            # Let the parser raise its own error for invalid arguments
+            yield from method(self, sbml_file, *args, **kwargs)
+            return
+
+        stat = os.fstat(sbml_file.fileno())
+        try:
+            key = pickle.dumps((
+                TRIPLE_CACHE_VERSION,
+                code_fingerprint,
+                type(self).__qualname__,
+                os.path.abspath(sbml_file.name),
+                stat.st_mtime_ns,
+                stat.st_size,
+                sorted((k, _freeze(v)) for k, v in arguments.items())
+            ))
+        except (TypeError, AttributeError, pickle.PicklingError):
+            # Arguments that cannot be pickled (e.g. dict views) cannot be
+            # part of a cache key, so parse without caching
+            yield from method(self, sbml_file, *args, **kwargs)
+            return
+        cache_path = TRIPLE_CACHE_DIR / "{}.pkl".format(hashlib.sha1(key).hexdigest())
+
+        triples = None
+        if use_cache:
+            try:
+                if time.time() - cache_path.stat().st_mtime <= TRIPLE_CACHE_MAX_AGE:
+                    with open(cache_path, "rb") as f:
+                        # Unpickling creates new string objects, so restore the
+                        # interning done by the parsers
+                        triples = [_intern(triple) for triple in pickle.load(f)]
+            except (OSError, pickle.UnpicklingError, EOFError):
+                pass
+
+        if triples is None:
+            triples = list(method(self, sbml_file, *args, **kwargs))
+            # Entries superseded by a new key (e.g. after the SBML file or parser
+            # changed) are never read again, so they are only removed once expired
+            _remove_expired_entries()
+            _write_entry(cache_path, triples)
+
+        yield from triples
+
+    return wrapped
+
+
+def clear_triple_cache():
+    """
+    Deletes every entry in TRIPLE_CACHE_DIR.
+    """
+    import shutil
+
+    shutil.rmtree(TRIPLE_CACHE_DIR, ignore_errors=True)
+
+
+def _remove_expired_entries():
+    """
+    Deletes entries in TRIPLE_CACHE_DIR older than TRIPLE_CACHE_MAX_AGE.
+    Only scans the directory once per process.
+    """
+    import os
+    import time
+
+    global _expired_entries_removed
+    if _expired_entries_removed:
+        return
+    _expired_entries_removed = True
+
+    now = time.time()
+    try:
+        entries = list(os.scandir(TRIPLE_CACHE_DIR))
+    except OSError:
+        return
+    for entry in entries:
+        try:
+            if now - entry.stat().st_mtime > TRIPLE_CACHE_MAX_AGE:
+                os.remove(entry.path)
+        except OSError:
+            pass
+
+
+def _write_entry(cache_path: Path, triples: list):
+    """
+    Pickles triples to cache_path. Failing to write the entry (e.g. to a
+    read-only home directory, or because a triple is unpicklable) is not an error.
+
+    :param cache_path: Path to cache entry.
+    :param triples: List of (Child, Edge, Parent) 3-tuples.
+    """
+    import pickle
+    from .write_atomic import write_atomic
+
+    try:
+        write_atomic(cache_path, lambda f: pickle.dump(triples, f, protocol=pickle.HIGHEST_PROTOCOL), binary=True)
+    except (TypeError, AttributeError, pickle.PicklingError):
+        pass
+
+
+def _bind_arguments(signature, *args, **kwargs):
+    """
+    Returns a dictionary of the arguments a parser is called with other than
+    self and the SBML file, with defaults applied, so equivalent positional,
+    keyword and omitted arguments produce the same cache key.
+    Raises TypeError if the arguments do not match the signature.
+
+    :param signature: inspect.Signature of BaseParser.parser() implementation.
+    :rtype: dict
+    """
+    from inspect import Parameter
+
+    bound = signature.bind(*args, **kwargs)
+    bound.apply_defaults()
+
+    arguments = {}
+    for name, param in list(signature.parameters.items())[2:]:
+        if param.kind == Parameter.VAR_KEYWORD:
+            arguments.update(bound.arguments[name])
+        else:
+            arguments[name] = bound.arguments[name]
+    return arguments
+
+
+def _fingerprint(method):
+    """
+    Returns a hash of the source of the module defining 'method', so cache
+    entries are invalidated when the parser changes. Falls back to the
+    method's bytecode if the source is unavailable.
+
+    :param method: BaseParser.parser() implementation.
+    :rtype: str
+    """
+    import hashlib
+    import inspect
+
+    try:
+        source = inspect.getsource(inspect.getmodule(method)).encode('utf8')
+    except (OSError, TypeError):
+        source = method.__code__.co_code
+    return hashlib.sha1(source).hexdigest()
+
+
+def _intern(value):
+    """
+    Recursively interns the strings in a triple loaded from the cache.
+
+    :param value: Triple, or a node, edge or attribute within one.
+    """
+    import sys
+
+    if isinstance(value, str):
+        return sys.intern(value)
+    if isinstance(value, tuple):
+        return tuple(_intern(v) for v in value)
+    if isinstance(value, list):
+        return [_intern(v) for v in value]
+    if isinstance(value, dict):
+        return {_intern(k): _intern(v) for k, v in value.items()}
+    return value
+
+
+def _freeze(value):
+    """
+    Returns a deterministically ordered version of 'value' for use in a
+    cache key (set iteration order varies between interpreter runs).
+
+    :param value: Parser keyword argument value.
+    """
+    if isinstance(value, (set, frozenset)):
+        return tuple(sorted(value))
+    return value
@@ -1,44 +1,79 @@
-from bs4 import BeautifulSoup
+from .helpers import RDF_NS
+from lxml import etree
+import sys
 
+_COMPARTMENT_TAGS = ('{*}compartment', '{*}listOfCompartments')
+_RDF_RESOURCES = etree.XPath('.//@rdf:resource', namespaces={'rdf': RDF_NS},
+                            smart_strings=False)
 
-def get_all_go_compartments(dirpath, skip_single_cmp_models=False):
+
+def get_all_go_compartments(dirpath, skip_single_cmp_models=False, max_workers=32,
+                            max_processes=None):
     """
     Extracts and returns all unique defined GO compartments from
-    BioModel SBML files contained inside dirpath.
+    BioModel SBML files contained inside dirpath, as a sorted tuple
+    of lowercased compartment names.
+
+    GO ids are collected from every file first (in parallel worker processes)
+    and then looked up concurrently, so each unique GO id is requested at most once.
 
     :param dirpath: Directory containing BioModel SBML files.
     :param skip_single_cmp_models: If True, does not parse sbml_file if it
                         is a single compartment model.
-    :rtype: set
+    :param max_workers: Maximum number of concurrent GO id lookups.
+    :param max_processes: Maximum number of processes used to parse SBML files.
+                        If None, uses the number of processors on the machine.
+    :rtype: tuple
     """
     from pathlib import Path
+    from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+    from functools import partial
+    from . import get_go_name, yield_model_paths
 
-    all_compartments = set()
-
-    for file in Path(dirpath).iterdir():
-        with open(str(file.resolve()), "r", encoding='utf8') as f:
-            soup = BeautifulSoup(f, features='lxml')
+    # Files are parsed independently, so spread parsing across processes
+    get_go_ids = partial(_get_compartment_go_ids, skip_single_cmp_models=skip_single_cmp_models)
+    go_ids = set()
+    with ProcessPoolExecutor(max_workers=max_processes) as executor:
+        for file_go_ids in executor.map(get_go_ids, yield_model_paths(Path(dirpath)), chunksize=16):
+            go_ids.update(file_go_ids)
 
-            if skip_single_cmp_models and len(soup.find_all("compartment")) < 2:
-                continue
-            for compartment in soup.find_all("compartment"):
-                all_compartments.update(_get_compartment_names(compartment))
+    # GO id lookups are network bound, so threads are sufficient
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        all_compartments = set(executor.map(get_go_name, go_ids))
 
-    return all_compartments
+    return tuple(sorted({sys.intern(c.lower()) for c in all_compartments}))
 
 
-def _get_compartment_names(compartment: BeautifulSoup):
+def _get_compartment_go_ids(filepath, skip_single_cmp_models=False):
     """
-    Given a BeautifulSoup compartment, returns a generator over all GO compartment
-    names defined by a GO ID URI.
+    Returns the set of all valid GO ids annotating the compartments
+    of an SBML file.
 
-    :param compartment: BeautifulSoup object containing an SBML compartment.
-    :rtype: generator
+    :param filepath: Path to SBML file.
+    :param skip_single_cmp_models: If True, returns an empty set if the
+                        SBML file is a single compartment model.
+    :rtype: set
     """
-    from . import get_go_json, go_id_is_valid
+    from . import go_id_is_valid
+
+    compartments = []
+    try:
+        for _, elem in etree.iterparse(filepath, events=('end',), tag=_COMPARTMENT_TAGS):
+            if elem.tag.endswith('}listOfCompartments'):
+                break
+            compartments.append(elem)
+    # lxml errors cannot be pickled back to the parent process, so skip the file here
+    except etree.XMLSyntaxError:
+        print("Could not extract SBML model for {}.".format(filepath))
+        return set()
+
+    if skip_single_cmp_models and len(compartments) < 2:
+        return set()
 
-    for uri_tag in compartment.find_all(attrs={"rdf:resource": True}):
-        go_id = uri_tag['rdf:resource'].split("/")[-1]
-        if go_id_is_valid(go_id):
-            compartment_name = get_go_json(go_id)['response']['docs'][0]['annotation_class_label']
-            yield compartment_name
+    go_ids = set()
+    for compartment in compartments:
+        for uri in _RDF_RESOURCES(compartment):
+            go_id = uri.split("/")[-1]
+            if go_id_is_valid(go_id):
+                go_ids.add(go_id)
+    return go_ids
@@ -1,13 +1,23 @@
 import requests
+from functools import lru_cache
+from pathlib import Path
 
-__all__ = ['get_go_json', 'go_id_is_valid']
+__all__ = ['get_go_json', 'get_go_name', 'go_id_is_valid', 'GO_CACHE_DIR']
 
+GOLR_URL = "http://golr-aux.geneontology.io/solr/select"
+# GOlr responses are cached on disk and re-requested once older than GO_CACHE_MAX_AGE seconds
+GO_CACHE_DIR = Path.home() / ".cache" / "biomodels" / "go"
+GO_CACHE_MAX_AGE = 30 * 24 * 60 * 60
 
-def get_go_json(go_id: str, session: requests.Session = None):
+
+def get_go_json(go_id: str, session: requests.Session = None, use_cache=True):
     """
     Requests and returns JSON data from GOlr for the element specified by go_id.
     Returns None if go_id is incorrectly formatted.
 
+    Responses are cached in GO_CACHE_DIR along with their source URL and retrieval
+    time, so repeated lookups of the same GO id do not hit the network.
+
     :param go_id: Seven digit identifier prefixed by GO (e.g. GO:0005634) that
                 uniquely identifies a gene ontology term element.
 
@@ -15,15 +25,45 @@ def get_go_json(go_id: str, session: requests.Session = None):
                 information.
     :param session: Requests session to use for HTTP request. If None, creates
                     a new session.
+    :param use_cache: If True, reads from and writes to the on-disk cache.
     :rtype: dict
     """
 
     if not go_id_is_valid(go_id):
         return None
 
+    cache_path = GO_CACHE_DIR / "{}.json".format(go_id.replace(':', '_'))
+    if use_cache:
+        cached = _read_cache(cache_path)
+        if cached is not None:
+            return cached['data']
+
     with session or requests.Session() as s:
         params = {'wt': 'json', 'q': 'id:"{}"'.format(go_id)}
-        return s.get("http://golr-aux.geneontology.io/solr/select", params=params).json()
+        r = s.get(GOLR_URL, params=params)
+        data = r.json()
+
+    if use_cache:
+        _write_cache(cache_path, {'go_id': go_id, 'source': r.url, 'data': data})
+    return data
+
+
+@lru_cache(maxsize=100_000)
+def get_go_name(go_id: str):
+    """
+    Returns the GO term name (annotation class label) for go_id,
+    e.g. 'nucleus' for GO:0005634. Returns None if go_id is incorrectly formatted.
+
+    Results are memoized for the lifetime of the process.
+
+    :param go_id: Seven digit identifier prefixed by GO (e.g. GO:0005634) that
+                uniquely identifies a gene ontology term element.
+    :rtype: str
+    """
+    go_json = get_go_json(go_id)
+    if go_json is None:
+        return None
+    return go_json['response']['docs'][0]['annotation_class_label']
 
 
 def go_id_is_valid(go_id: str) -> bool:
@@ -40,6 +80,42 @@ def go_id_is_valid(go_id: str) -> bool:
     return bool(re.match(r"GO:[0-9]{7}$", go_id))
 
 
+def _read_cache(cache_path: Path):
+    """
+    Returns the cached entry stored at cache_path, or None if it
+    does not exist, is stale or cannot be read.
+
+    :param cache_path: Path to cache entry.
+    :rtype: dict
+    """
+    import json
+    import time
+
+    try:
+        if time.time() - cache_path.stat().st_mtime > GO_CACHE_MAX_AGE:
+            return None
+        with open(cache_path, "r", encoding='utf8') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+
+def _write_cache(cache_path: Path, entry: dict):
+    """
+    Writes a cache entry to cache_path, stamped with its retrieval time.
+    Failing to write the entry (e.g. to a read-only home directory) is not an error.
+
+    :param cache_path: Path to cache entry.
+    :param entry: JSON-serializable cache entry.
+    """
+    import json
+    import time
+    from .write_atomic import write_atomic
+
+    entry = dict(entry, retrieved=time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()))
+    write_atomic(cache_path, lambda f: json.dump(entry, f))
+
+
 if __name__ == '__main__':
     from pprint import pprint
 
@@ -1,42 +1,98 @@
-from bs4 import BeautifulSoup
+from lxml import etree
 from typing import TextIO
+import libsbml
+import sys
 
 __all__ = [
+    'RDF_NS',
+    'w3cdtf_to_date',
+    'parse_annotation',
     'extract_publication_date',
     'extract_annotation_identifiers',
     'extract_model_data'
 ]
 
+RDF_NS = 'http://www.w3.org/1999/02/22-rdf-syntax-ns#'
 
-def extract_publication_date(soup: BeautifulSoup):
+_RDF_RESOURCES = etree.XPath('//@rdf:resource', namespaces={'rdf': RDF_NS}, smart_strings=False)
+
+# Namespaces SBML files commonly declare on the <sbml> element instead of in each annotation
+_ANNOTATION_NAMESPACES = {
+    'rdf': RDF_NS,
+    'bqbiol': 'http://biomodels.net/biology-qualifiers/',
+    'bqmodel': 'http://biomodels.net/model-qualifiers/',
+    'dc': 'http://purl.org/dc/elements/1.1/',
+    'dcterms': 'http://purl.org/dc/terms/',
+    'vCard': 'http://www.w3.org/2001/vcard-rdf/3.0#',
+}
+_ANNOTATION_WRAPPER = '<annotationWrapper {}>{{}}</annotationWrapper>'.format(
+    ' '.join('xmlns:{}="{}"'.format(prefix, uri) for prefix, uri in _ANNOTATION_NAMESPACES.items())
+)
+_RECOVER_PARSER = etree.XMLParser(recover=True)
+
+
+def w3cdtf_to_date(dt: str):
+    """
+    Converts a W3C date-time string (e.g. 2005-02-02T14:56:11Z)
+    to a YYYY-MM-DD date string.
+
+    :param dt: W3CDTF date-time string.
+    :rtype: str
+    """
+    # W3CDTF date-times always start with YYYY-MM-DD
+    return dt[:10]
+
+
+def parse_annotation(annotation_str: str):
+    """
+    Parses an SBML annotation string and returns its root lxml Element,
+    or None if the annotation cannot be parsed.
+
+    libsbml does not copy namespace declarations inherited from the <sbml>
+    element into annotation strings. If a prefix is unbound, the annotation is
+    parsed again inside a wrapper element declaring the common SBML annotation
+    namespaces (the wrapper is then the returned root).
+
+    :param annotation_str: RDF/XML string with a top-level SBML <annotation> tag.
+    :rtype: lxml.etree._Element
     """
-    Extracts the publication date of an SBML model.
+    try:
+        return etree.fromstring(annotation_str)
+    except etree.XMLSyntaxError:
+        return etree.fromstring(_ANNOTATION_WRAPPER.format(annotation_str), _RECOVER_PARSER)
 
-    :param soup: bs4.BeautifulSoup object initialized with
-            an SBML model's XML markup.
+
+def extract_publication_date(model: libsbml.Model):
+    """
+    Extracts the publication date of an SBML model from its model history.
+    Returns None if the model has no creation date.
+
+    :param model: libsbml.Model object.
     :rtype: str
     """
-    from dateutil import parser
+    history = model.getModelHistory() if model is not None else None
+    if history is None or not history.isSetCreatedDate():
+        return None
 
-    dt = soup.find("dcterms:created").find("dcterms:w3cdtf").text
-    return str(parser.parse(dt).date())
+    return w3cdtf_to_date(history.getCreatedDate().getDateAsString())
 
 
 def extract_annotation_identifiers(annotation_str: str):
     """
-    Returns a generator over all URI identifiers present within
+    Returns a tuple of all URI identifiers present within
     an SBML annotation.
 
     :param annotation_str: Valid RDF/XML string with a
                             top-level SBML <annotation> tag.
-    :rtype: generator
+    :rtype: tuple
     """
-    soup = BeautifulSoup(annotation_str, features='lxml')
-    for tag in soup.find_all(attrs={"rdf:resource": True}):
-        yield tag['rdf:resource']
+    root = parse_annotation(annotation_str) if annotation_str else None
+    if root is None:
+        return ()
+    return tuple(_RDF_RESOURCES(root))
 
 
-def extract_model_data(sbml_file: TextIO, soup: BeautifulSoup = None):
+def extract_model_data(sbml_file: TextIO, model: libsbml.Model = None):
     """
     Returns a dictionary containing the following SBML model data:
 
@@ -47,28 +103,51 @@ def extract_model_data(sbml_file: TextIO, soup: BeautifulSoup = None):
         "created": <model publication date>
     }
 
-    Sets the file pointer to the start of sbml_file after extraction.
+    "created" is omitted if the model has no creation date.
 
     :param sbml_file: SBML file handle.
-    :param soup: bs4.BeautifulSoup object initialized with sbml_file markup.
-                If None, initializes a new bs4.BeautifulSoup object with sbml_file
-                markup.
+    :param model: libsbml.Model object read from sbml_file. If None,
+                reads the model from sbml_file with libsbml.
     :rtype: dict
     """
     from os.path import basename
 
-    soup = soup or BeautifulSoup(sbml_file, features='lxml')
-
-    model_name = str(basename(sbml_file.name).split('.')[0])
+    # Model names, URIs and dates recur across graphs (e.g. as parents of
+    # derived models), so intern them to share a single copy of each string.
+    model_name = sys.intern(basename(sbml_file.name).split('.')[0])
     model_provider = 'biomodels.db'
-    model_uri = 'http://identifiers.org/biomodels.db/' + model_name
-    model_publication_date = extract_publication_date(soup)
-
-    sbml_file.seek(0)
-
-    return {
+    model_uri = sys.intern('http://identifiers.org/biomodels.db/' + model_name)
+    if model is None:
+        model = libsbml.readSBMLFromFile(sbml_file.name).getModel()
+    if _has_unread_rdf(model):
+        print("Could not read model history or annotations for {}. "
+              "Check that rdf:about matches the model metaid.".format(sbml_file.name))
+
+    model_data = {
         "name": model_name,
         "provider": model_provider,
-        "URI": model_uri,
-        "created": model_publication_date
+        "URI": model_uri
     }
+    # Graph writers such as write_graphml cannot serialize None attributes
+    model_publication_date = extract_publication_date(model)
+    if model_publication_date is not None:
+        model_data["created"] = sys.intern(model_publication_date)
+    return model_data
+
+
+def _has_unread_rdf(model: libsbml.Model):
+    """
+    Returns True if a model's annotation contains RDF descriptions
+    but libsbml read neither a model history nor any CVTerms from it.
+    libsbml ignores descriptions whose rdf:about does not match the
+    model metaid.
+
+    :param model: libsbml.Model object.
+    :rtype: bool
+    """
+    if (model is None or not model.isSetAnnotation()
+            or model.isSetModelHistory() or model.getNumCVTerms() > 0):
+        return False
+
+    root = parse_annotation(model.getAnnotationString())
+    return root is not None and next(root.iter('{%s}Description' % RDF_NS), None) is not None
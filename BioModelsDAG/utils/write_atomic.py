@@ -0,0 +1,42 @@
+from pathlib import Path
+from typing import Callable, IO
+
+__all__ = ['write_atomic']
+
+
+def write_atomic(filepath: Path, dump: Callable[[IO], None], binary=False) -> bool:
+    """
+    Writes a file by calling dump() on a temporary file in the same
+    directory and then renaming it to filepath, so concurrent readers never
+    see a partially written file. Returns True if the file was written.
+
+    Returns False instead of raising if the file cannot be written
+    (e.g. the directory is read-only), so on-disk caches never fail
+    the computation whose result they store.
+
+    :param filepath: Path to file.
+    :param dump: Function that writes the file's contents to a file object.
+    :param binary: If True, opens the temporary file in binary mode.
+    :rtype: bool
+    """
+    import os
+    import tempfile
+
+    tmp_path = None
+    try:
+        filepath.parent.mkdir(parents=True, exist_ok=True)
+        # mkstemp gives each process and thread its own temporary file
+        fd, tmp_path = tempfile.mkstemp(dir=filepath.parent, prefix=filepath.name + ".", suffix=".tmp")
+        with (os.fdopen(fd, "wb") if binary else os.fdopen(fd, "w", encoding='utf8')) as f:
+            dump(f)
+        os.replace(tmp_path, filepath)
+        return True
+    except BaseException as e:
+        if tmp_path is not None:
+            try:
+                os.remove(tmp_path)
+            except OSError:
+                pass
+        if isinstance(e, OSError):
+            return False
+        raise
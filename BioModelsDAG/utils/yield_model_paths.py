@@ -1,9 +1,11 @@
 from pathlib import Path
+import os
 
 
 def yield_model_paths(dirpath: Path = None):
     """
     Returns a generator over all curated model filepaths.
+    Subdirectories of the curated model directory are skipped.
     Uses dirpath as the curated model directory if provided;
     otherwise, assumes the following project structure:
 
@@ -28,5 +30,8 @@ def yield_model_paths(dirpath: Path = None):
     if not dirpath.exists():
         raise FileExistsError("'{}' is not a valid directory path.".format(dirpath))
 
-    for model_path in dirpath.iterdir():
-        yield str(model_path.resolve())
+    # scandir entries cache their file type, so no extra stat call is needed per file
+    with os.scandir(dirpath.resolve()) as entries:
+        for entry in entries:
+            if entry.is_file():
+                yield entry.path